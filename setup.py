@@ -32,7 +32,6 @@ setup(
         'grpcio-tools',
         'pyasn1',
         'pyasn1-modules',
-        'pem',
     ],
     python_requires='>=3.9',
 )
@@ -2,8 +2,19 @@
 This module manages X.509 Bundle objects.
 """
 
+import functools
+import os
 import threading
-from typing import Set, Optional
+import time
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+)
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.x509 import Certificate
@@ -18,13 +29,26 @@ from pyspiffe.spiffe_id.errors import MISSING_TRUST_DOMAIN
 from pyspiffe.spiffe_id.spiffe_id import TrustDomain
 from pyspiffe.utils.certificate_utils import (
     parse_pem_certificates,
-    parse_der_certificates,
+    parse_der_certificates_iter,
     load_certificates_bytes_from_file,
     write_certificates_to_file,
 )
 
 __all__ = ['X509Bundle']
 
+_ALLOWED_ENCODINGS = frozenset((serialization.Encoding.PEM, serialization.Encoding.DER))
+
+# files modified this recently are not cached: a coarse filesystem clock (up to 2 seconds on FAT)
+# lets a second write within the same tick leave every timestamp in the cache key unchanged
+_RACY_TIMESTAMP_WINDOW_NS = 2 * 10**9
+
+_CERTIFICATE_PARSERS: Dict[
+    serialization.Encoding, Callable[[bytes], Iterable[Certificate]]
+] = {
+    serialization.Encoding.PEM: parse_pem_certificates,
+    serialization.Encoding.DER: parse_der_certificates_iter,
+}
+
 
 class X509Bundle(object):
     """Represents a collection of trusted X.509 authorities for a trust domain."""
@@ -32,7 +56,7 @@ class X509Bundle(object):
     def __init__(
         self,
         trust_domain: TrustDomain,
-        x509_authorities: Optional[Set[Certificate]],
+        x509_authorities: Optional[AbstractSet[Certificate]],
     ) -> None:
         """Creates a X509Bundle instance.
 
@@ -44,43 +68,56 @@ class X509Bundle(object):
             X509BundleError: In case the trust_domain is empty.
         """
 
-        self.lock = threading.Lock()
-
         if not trust_domain:
             raise X509BundleError(MISSING_TRUST_DOMAIN)
 
         self._trust_domain = trust_domain
-        self._x509_authorities = x509_authorities.copy() if x509_authorities else set()
+        # the set of authorities is never mutated, writers replace it with a new one so that
+        # readers don't need to lock
+        self._x509_authorities: FrozenSet[Certificate] = (
+            frozenset(x509_authorities) if x509_authorities else frozenset()
+        )
+        self._write_lock = threading.Lock()
 
     def __eq__(self, o: object) -> bool:
+        if self is o:
+            return True
         if not isinstance(o, X509Bundle):
             return False
-        with self.lock:
-            return (
-                self._trust_domain.__eq__(o._trust_domain)
-                and self._x509_authorities == o._x509_authorities
-            )
+        if len(self._x509_authorities) != len(o._x509_authorities):
+            return False
+        return (
+            self._trust_domain == o._trust_domain
+            and self._x509_authorities == o._x509_authorities
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._trust_domain, self._x509_authorities))
 
     def trust_domain(self) -> TrustDomain:
         """Returns the trust domain of the bundle."""
         return self._trust_domain
 
-    def x509_authorities(self) -> Set[Certificate]:
-        """Returns a copy of set of X.509 authorities in the bundle."""
-        with self.lock:
-            return self._x509_authorities.copy()
+    def x509_authorities(self) -> FrozenSet[Certificate]:
+        """Returns the set of X.509 authorities in the bundle.
+
+        The returned set is immutable, use add_authority and remove_authority to change the bundle.
+        """
+        return self._x509_authorities
 
     def add_authority(self, x509_authority: Certificate) -> None:
         """Adds an X.509 authority to the bundle."""
-        with self.lock:
-            self._x509_authorities.add(x509_authority)
+        if x509_authority in self._x509_authorities:
+            return
+        with self._write_lock:
+            self._x509_authorities = self._x509_authorities | {x509_authority}
 
     def remove_authority(self, x509_authority: Certificate) -> None:
         """Removes an X.509 authority from the bundle."""
-        with self.lock:
-            if not self._x509_authorities:
-                return
-            self._x509_authorities.remove(x509_authority)
+        if x509_authority not in self._x509_authorities:
+            return
+        with self._write_lock:
+            self._x509_authorities = self._x509_authorities - {x509_authority}
 
     def save(
         self,
@@ -99,11 +136,9 @@ class X509Bundle(object):
                                 converting or writing the authorities bytes to the file.
         """
 
-        if encoding not in [encoding.PEM, encoding.DER]:
+        if encoding not in _ALLOWED_ENCODINGS:
             raise ArgumentError(
-                'Encoding not supported: {}. Expected \'PEM\' or \'DER\''.format(
-                    encoding
-                )
+                f"Encoding not supported: {encoding}. Expected 'PEM' or 'DER'"
             )
         try:
             write_certificates_to_file(bundle_path, encoding, self._x509_authorities)
@@ -129,11 +164,11 @@ class X509Bundle(object):
         """
 
         try:
-            authorities = parse_pem_certificates(bundle_bytes)
+            authorities = frozenset(parse_pem_certificates(bundle_bytes))
         except Exception as e:
             raise ParseX509BundleError(str(e))
 
-        return X509Bundle(trust_domain, set(authorities))
+        return cls(trust_domain, authorities)
 
     @classmethod
     def parse_raw(cls, trust_domain: TrustDomain, bundle_bytes: bytes) -> 'X509Bundle':
@@ -152,11 +187,11 @@ class X509Bundle(object):
         """
 
         try:
-            authorities = parse_der_certificates(bundle_bytes)
+            authorities = frozenset(parse_der_certificates_iter(bundle_bytes))
         except Exception as e:
             raise ParseX509BundleError(str(e))
 
-        return X509Bundle(trust_domain, set(authorities))
+        return cls(trust_domain, authorities)
 
     @classmethod
     def load(
@@ -167,6 +202,8 @@ class X509Bundle(object):
     ) -> 'X509Bundle':
         """Loads an X.509 bundle from a file in disk containing DER or PEM encoded trusted authorities.
 
+        Parsed authorities are cached per file while the file stays unchanged.
+
         Args:
             trust_domain: A trust domain to associate to the bundle.
             bundle_path: Path to the file containing a set of X.509 authorities.
@@ -177,20 +214,71 @@ class X509Bundle(object):
 
         Raises:
             X509BundleError: In case the trust_domain is empty.
-            LoadX509BundleError: In case the set of x509_authorities cannot be parsed from the bundle_bytes.
+            LoadX509BundleError: In case the file in bundle_path cannot be read.
+            ParseX509BundleError: In case the set of x509_authorities cannot be parsed from the file.
+            ArgumentError: In case the encoding is not either PEM or DER (from serialization.Encoding).
         """
 
+        if encoding not in _ALLOWED_ENCODINGS:
+            raise ArgumentError(
+                f"Encoding not supported: {encoding}. Expected 'PEM' or 'DER'"
+            )
+
+        bundle_path = os.fspath(bundle_path)
         try:
-            bundle_bytes = load_certificates_bytes_from_file(bundle_path)
-        except Exception as e:
-            raise LoadX509BundleError(str(e))
+            file_stat = os.stat(bundle_path)
+        except OSError:
+            # the file cannot be cached, reading it reports the error
+            file_stat = None
+
+        if file_stat is None or _is_racy(file_stat):
+            authorities = _load_x509_authorities.__wrapped__(
+                bundle_path, None, encoding
+            )
+        else:
+            file_key = (
+                file_stat.st_dev,
+                file_stat.st_ino,
+                file_stat.st_mtime_ns,
+                file_stat.st_ctime_ns,
+                file_stat.st_size,
+            )
+            authorities = _load_x509_authorities(bundle_path, file_key, encoding)
 
-        if encoding == serialization.Encoding.PEM:
-            return cls.parse(trust_domain, bundle_bytes)
+        return cls(trust_domain, authorities)
 
-        if encoding == serialization.Encoding.DER:
-            return cls.parse_raw(trust_domain, bundle_bytes)
 
-        raise ArgumentError(
-            'Encoding not supported: {}. Expected \'PEM\' or \'DER\''.format(encoding)
-        )
+@functools.lru_cache(maxsize=32)
+def _load_x509_authorities(
+    bundle_path: str,
+    file_key: Optional[Tuple[int, int, int, int, int]],
+    encoding: serialization.Encoding,
+) -> FrozenSet[Certificate]:
+    """Reads and parses the X.509 authorities from a bundle file.
+
+    Results are cached by file_key (device, inode, modification and change times, and size of the file),
+    so an unchanged bundle file is not parsed again. The change time is part of the key because it cannot
+    be set from userspace, so a later rewrite that restores the modification time is still detected.
+
+    Rewrites within a single tick of the filesystem clock leave the key unchanged, so callers must not
+    cache files modified that recently (see _is_racy).
+    """
+
+    try:
+        bundle_bytes = load_certificates_bytes_from_file(bundle_path)
+    except Exception as e:
+        raise LoadX509BundleError(str(e))
+
+    try:
+        return frozenset(_CERTIFICATE_PARSERS[encoding](bundle_bytes))
+    except Exception as e:
+        raise ParseX509BundleError(str(e))
+
+
+def _is_racy(file_stat: os.stat_result) -> bool:
+    """Returns True if the file was modified too recently for its timestamps to tell later writes apart.
+
+    This follows git's handling of "racily clean" index entries.
+    """
+    last_change_ns = max(file_stat.st_mtime_ns, file_stat.st_ctime_ns)
+    return time.time_ns() - last_change_ns < _RACY_TIMESTAMP_WINDOW_NS
@@ -11,7 +11,7 @@ from cryptography.hazmat.primitives import serialization
 from pyspiffe.spiffe_id.spiffe_id import SpiffeId
 from pyspiffe.bundle.jwt_bundle.jwt_bundle import JwtBundle
 from pyspiffe.bundle.jwt_bundle.exceptions import AuthorityNotFoundError
-from pyspiffe.svid.jwt_svid_validator import JwtSvidValidator
+from pyspiffe.svid.jwt_svid_validator import DEFAULT_VALIDATOR
 from pyspiffe.svid.exceptions import InvalidTokenError
 
 
@@ -70,10 +70,9 @@ class JwtSvid(object):
             raise ArgumentError(INVALID_INPUT_ERROR.format('token cannot be empty'))
         try:
             header_params = jwt.get_unverified_header(token)
-            validator = JwtSvidValidator()
-            validator.validate_header(header_params)
+            DEFAULT_VALIDATOR.validate_header(header_params)
             claims = jwt.decode(token, options={'verify_signature': False})
-            validator.validate_claims(claims, expected_audience)
+            DEFAULT_VALIDATOR.validate_claims(claims, expected_audience)
             spiffe_id = SpiffeId.parse(claims['sub'])
             return JwtSvid(spiffe_id, claims['aud'], claims['exp'], claims, token)
         except PyJWTError as err:
@@ -116,8 +115,7 @@ class JwtSvid(object):
             )
         try:
             header_params = jwt.get_unverified_header(token)
-            validator = JwtSvidValidator()
-            validator.validate_header(header_params)
+            DEFAULT_VALIDATOR.validate_header(header_params)
             key_id = header_params.get('kid')
             signing_key = jwt_bundle.get_jwt_authority(key_id)
             if not signing_key:
@@ -2,9 +2,8 @@
 This module manages the validations of JWT tokens.
 """
 
-import datetime
-from typing import List, Dict, Any
-from calendar import timegm
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Union
 
 from pyspiffe.svid import INVALID_INPUT_ERROR
 from pyspiffe.exceptions import ArgumentError
@@ -19,15 +18,12 @@ from pyspiffe.svid.exceptions import (
 AUDIENCE_NOT_MATCH_ERROR = 'audience does not match expected value'
 """str: audience does not match error message."""
 
+_HEADER_EMPTY_ERROR = INVALID_INPUT_ERROR.format('header cannot be empty')
+_ALG_EMPTY_ERROR = INVALID_INPUT_ERROR.format('header alg cannot be empty')
+_AUDIENCE_EMPTY_ERROR = INVALID_INPUT_ERROR.format('expected_audience cannot be empty')
 
-class JwtSvidValidator(object):
-    """Performs validations on a given token checking compliance to SPIFFE specification.
-    See `SPIFFE JWT-SVID standard <https://github.com/spiffe/spiffe/blob/master/standards/JWT-SVID.md>`
-
-    """
-
-    _REQUIRED_CLAIMS = ['aud', 'exp', 'sub']
-    _SUPPORTED_ALGORITHMS = [
+_SUPPORTED_ALGORITHMS = frozenset(
+    {
         'RS256',
         'RS384',
         'RS512',
@@ -37,9 +33,17 @@ class JwtSvidValidator(object):
         'PS256',
         'PS384',
         'PS512',
-    ]
+    }
+)
 
-    _SUPPORTED_TYPES = ['JWT', 'JOSE']
+_SUPPORTED_TYPES = frozenset({'JWT', 'JOSE'})
+
+
+class JwtSvidValidator(object):
+    """Performs validations on a given token checking compliance to SPIFFE specification.
+    See `SPIFFE JWT-SVID standard <https://github.com/spiffe/spiffe/blob/master/standards/JWT-SVID.md>`
+
+    """
 
     def __init__(self) -> None:
         pass
@@ -61,19 +65,17 @@ class JwtSvidValidator(object):
             InvalidTypeError: In case 'typ' is present in header but is not set to 'JWT' or 'JOSE'.
         """
         if not parameters:
-            raise ArgumentError(INVALID_INPUT_ERROR.format('header cannot be empty'))
+            raise ArgumentError(_HEADER_EMPTY_ERROR)
 
         alg = parameters.get('alg')
         if not alg:
-            raise ArgumentError(
-                INVALID_INPUT_ERROR.format('header alg cannot be empty')
-            )
+            raise ArgumentError(_ALG_EMPTY_ERROR)
 
-        if alg not in self._SUPPORTED_ALGORITHMS:
+        if alg not in _SUPPORTED_ALGORITHMS:
             raise InvalidAlgorithmError(alg)
 
         typ = parameters.get('typ')
-        if typ and typ not in self._SUPPORTED_TYPES:
+        if typ and typ not in _SUPPORTED_TYPES:
             raise InvalidTypeError(typ)
 
     def validate_claims(
@@ -94,36 +96,50 @@ class JwtSvidValidator(object):
             TokenExpiredError: In case token is expired.
             ArgumentError: In case expected_audience is empty.
         """
-        for claim in self._REQUIRED_CLAIMS:
-            if not payload.get(claim):
-                raise MissingClaimError(claim)
+        aud = payload.get('aud')
+        if not aud:
+            raise MissingClaimError('aud')
+
+        exp = payload.get('exp')
+        if not exp:
+            raise MissingClaimError('exp')
+
+        if not payload.get('sub'):
+            raise MissingClaimError('sub')
+
+        self._validate_exp(exp)
+
+        try:
+            audience_claim = _to_audience_set(aud)
+        except TypeError:
+            # the claim comes from the token and may hold values that are not strings
+            raise InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)
 
-        self._validate_exp(str(payload.get('exp')))
-        self._validate_aud(payload.get('aud', []), expected_audience)
+        self._validate_aud(audience_claim, expected_audience)
 
-    def _validate_exp(self, expiration_date: str) -> None:
+    def _validate_exp(self, expiration_date: Union[int, float, str]) -> None:
         """Verifies expiration.
 
         Note: If and when https://github.com/jpadilla/pyjwt/issues/599 is fixed, this can be simplified/removed.
 
         Args:
-            expiration_date: Date to check if it is expired.
+            expiration_date: Expiration time as seconds since the epoch to check if it is expired.
 
         Raises:
             TokenExpiredError: In case it is expired.
         """
-        int_date = int(expiration_date)
-        utctime = timegm(datetime.datetime.utcnow().utctimetuple())
-        if int_date < utctime:
+        if int(expiration_date) < int(time.time()):
             raise TokenExpiredError()
 
     def _validate_aud(
-        self, audience_claim: List[str], expected_audience: List[str]
+        self,
+        audience_claim: Union[Set[str], FrozenSet[str]],
+        expected_audience: Iterable[str],
     ) -> None:
         """Verifies if expected_audience is present in audience_claim. The aud claim MUST be present.
 
         Args:
-            audience_claim: List of token's audience claim to be validated.
+            audience_claim: Set of the token's audience claim to be validated.
             expected_audience: Set of the claims expected to be present in the token's audience claim.
 
         Raises:
@@ -131,12 +147,28 @@ class JwtSvidValidator(object):
             ArgumentError: In case expected_audience is empty.
         """
         if not expected_audience:
-            raise ArgumentError(
-                INVALID_INPUT_ERROR.format('expected_audience cannot be empty')
-            )
+            raise ArgumentError(_AUDIENCE_EMPTY_ERROR)
 
-        if not audience_claim or all(aud == '' for aud in audience_claim):
+        if not any(audience_claim):
             raise InvalidClaimError('audience_claim cannot be empty')
 
-        if not all(aud in audience_claim for aud in expected_audience):
+        if not audience_claim.issuperset(expected_audience):
             raise InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)
+
+
+def _to_audience_set(
+    audience_claim: Union[str, Iterable[str]]
+) -> Union[Set[str], FrozenSet[str]]:
+    """Returns the 'aud' claim, either a single string or a collection of strings, as a set.
+
+    A claim that already is a set is returned as is.
+    """
+    if isinstance(audience_claim, (set, frozenset)):
+        return audience_claim
+    if isinstance(audience_claim, str):
+        return frozenset((audience_claim,))
+    return frozenset(audience_claim)
+
+
+DEFAULT_VALIDATOR = JwtSvidValidator()
+"""JwtSvidValidator: shared validator instance, the validator holds no state."""
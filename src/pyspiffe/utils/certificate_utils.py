@@ -1,7 +1,7 @@
-from typing import List, Iterable, Union
+from typing import List, Iterable, Iterator, Union
 
 import os
-import pem
+import re
 from cryptography import x509
 from cryptography.hazmat.primitives.asymmetric import (
     ed25519,
@@ -36,6 +36,37 @@ from pyspiffe.utils.exceptions import (
 _CERTS_FILE_MODE = 0o644
 _PRIVATE_KEY_FILE_MODE = 0o600
 
+# PEM block types recognized when parsing certificates. Blocks of other types are ignored, blocks of
+# these types that are not certificates are rejected.
+_PEM_LABELS = (
+    b'CERTIFICATE',
+    b'CERTIFICATE REQUEST',
+    b'DH PARAMETERS',
+    b'DSA PRIVATE KEY',
+    b'EC PRIVATE KEY',
+    b'ENCRYPTED PRIVATE KEY',
+    b'NEW CERTIFICATE REQUEST',
+    b'OPENSSH PRIVATE KEY',
+    b'PRIVATE KEY',
+    b'PUBLIC KEY',
+    b'RSA PRIVATE KEY',
+    b'RSA PUBLIC KEY',
+    b'SSH2 ENCRYPTED PRIVATE KEY',
+    b'SSH2 PUBLIC KEY',
+    b'TRUSTED CERTIFICATE',
+    b'X509 CRL',
+)
+
+_PEM_BLOCK_RE = re.compile(
+    rb'----[- ]BEGIN ('
+    + b'|'.join(_PEM_LABELS)
+    + rb')[- ]----\r?\n.+?\r?\n----[- ]END \1[- ]----',
+    re.DOTALL,
+)
+
+# available from cryptography 39.0
+_load_pem_x509_certificates = getattr(x509, 'load_pem_x509_certificates', None)
+
 PRIVATE_KEY_TYPES = Union[
     dh.DHPrivateKey,
     ed25519.Ed25519PrivateKey,
@@ -61,16 +92,50 @@ def parse_pem_certificates(pem_bytes: bytes) -> List[Certificate]:
         ParseCertificateError: In case the certificates cannot be parsed from the pem_bytes.
     """
 
-    parsed_certs = pem.parse(pem_bytes)
-    if not parsed_certs:
-        raise ParseCertificateError('Unable to parse PEM X.509 certificate')
+    # The batch loader of cryptography decodes all the blocks in a single call into its native
+    # backend, but it accepts and skips different block types than parse_pem_certificates_iter.
+    # It is only used when every block in the input is a certificate block matched by
+    # _PEM_BLOCK_RE, any other input goes through the iterator.
+    if _load_pem_x509_certificates is not None:
+        labels = _PEM_BLOCK_RE.findall(pem_bytes)
+        if (
+            labels
+            and all(label == b'CERTIFICATE' for label in labels)
+            and pem_bytes.count(b'BEGIN ') == len(labels)
+        ):
+            try:
+                certs = _load_pem_x509_certificates(pem_bytes)
+            except Exception:
+                certs = None
+            if certs is not None and len(certs) == len(labels):
+                return certs
+
+    return list(parse_pem_certificates_iter(pem_bytes))
+
+
+def parse_pem_certificates_iter(pem_bytes: bytes) -> Iterator[Certificate]:
+    """Lazily parses certificates from PEM bytes, decoding one PEM block at a time.
 
-    try:
-        return [
-            x509.load_pem_x509_certificate(x509_cert.as_bytes(), default_backend())
-            for x509_cert in parsed_certs
-        ]
-    except Exception:
+    Args:
+        pem_bytes: List of X.509 certificates as PEM blocks bytes.
+
+    Returns:
+        An iterator over the Certificate objects.
+
+    Raises:
+        ParseCertificateError: In case the certificates cannot be parsed from the pem_bytes.
+    """
+
+    found = False
+    for block in _PEM_BLOCK_RE.finditer(pem_bytes):
+        found = True
+        try:
+            cert = x509.load_pem_x509_certificate(block.group(0), default_backend())
+        except Exception:
+            raise ParseCertificateError('Unable to parse PEM X.509 certificate')
+        yield cert
+
+    if not found:
         raise ParseCertificateError('Unable to parse PEM X.509 certificate')
 
 
@@ -87,16 +152,32 @@ def parse_der_certificates(der_bytes: bytes) -> List[Certificate]:
         ParseCertificateError: In case the certificates cannot be parsed from the der_bytes.
     """
 
-    try:
-        result = []
-        cert, remaining_data = decode(der_bytes, Pyasn1Certificate())
-        result.append(x509.load_der_x509_certificate(encode(cert)))
-        while len(remaining_data) > 0:
+    return list(parse_der_certificates_iter(der_bytes))
+
+
+def parse_der_certificates_iter(der_bytes: bytes) -> Iterator[Certificate]:
+    """Lazily parses certificates from ASN.1 DER bytes, decoding one certificate at a time.
+
+    Args:
+        der_bytes: List of X.509 certificates as ASN.1 DER bytes.
+
+    Returns:
+        An iterator over the Certificate objects.
+
+    Raises:
+        ParseCertificateError: In case the certificates cannot be parsed from the der_bytes.
+    """
+
+    remaining_data = der_bytes
+    while True:
+        try:
             cert, remaining_data = decode(remaining_data, Pyasn1Certificate())
-            result.append(x509.load_der_x509_certificate(encode(cert)))
-        return result
-    except Exception:
-        raise ParseCertificateError('Unable to parse DER X.509 certificate')
+            x509_cert = x509.load_der_x509_certificate(encode(cert))
+        except Exception:
+            raise ParseCertificateError('Unable to parse DER X.509 certificate')
+        yield x509_cert
+        if len(remaining_data) == 0:
+            return
 
 
 def load_certificates_bytes_from_file(certificates_file_path: str) -> bytes:
@@ -263,8 +344,9 @@ def parse_pem_private_key(pem_bytes: bytes) -> PRIVATE_KEY_TYPES:
 
 
 def _load_bytes_from_file(file_path: str) -> bytes:
-    with open(file_path, 'rb') as file:
-        return file.read()
+    # The whole file is read at once, so an extra buffering layer only adds a copy.
+    with open(file_path, 'rb', buffering=0) as file:
+        return file.readall()
 
 
 def _extract_private_key_bytes(
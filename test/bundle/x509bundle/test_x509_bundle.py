@@ -1,3 +1,7 @@
+import os
+import time
+from types import SimpleNamespace
+
 import pem
 import pytest
 from cryptography import x509
@@ -11,6 +15,7 @@ from pyspiffe.bundle.x509_bundle.exceptions import (
     LoadX509BundleError,
     SaveX509BundleError,
 )
+from pyspiffe.bundle.x509_bundle import x509_bundle as x509_bundle_module
 from pyspiffe.bundle.x509_bundle.x509_bundle import X509Bundle
 from pyspiffe.spiffe_id.spiffe_id import TrustDomain
 from pyspiffe.exceptions import ArgumentError
@@ -27,7 +32,7 @@ def test_parse_raw_bundle_single_authority():
     assert x509_bundle.trust_domain() == trust_domain
     assert len(x509_bundle.x509_authorities()) == 1
 
-    authority = x509_bundle.x509_authorities().pop()
+    (authority,) = x509_bundle.x509_authorities()
     assert isinstance(authority, Certificate)
     assert 'CN=PEMUTILTEST1' == authority.subject.rfc4514_string()
 
@@ -41,11 +46,10 @@ def test_parse_raw_bundle_multiple_authorities():
     assert len(x509_bundle.x509_authorities()) == 2
 
     expected_subjects = ['O=SPIRE,C=US', 'O=SPIFFE,C=US']
-    authority1 = x509_bundle.x509_authorities().pop()
+    authority1, authority2 = x509_bundle.x509_authorities()
     assert isinstance(authority1, Certificate)
     assert authority1.subject.rfc4514_string() in expected_subjects
 
-    authority2 = x509_bundle.x509_authorities().pop()
     assert isinstance(authority2, Certificate)
     assert authority2.subject.rfc4514_string() in expected_subjects
 
@@ -57,7 +61,7 @@ def test_parse_bundle_single_authority():
 
     assert x509_bundle.trust_domain() == trust_domain
     assert len(x509_bundle.x509_authorities()) == 1
-    authority = x509_bundle.x509_authorities().pop()
+    (authority,) = x509_bundle.x509_authorities()
     assert isinstance(authority, Certificate)
     assert 'CN=PEMUTILTEST1' == authority.subject.rfc4514_string()
 
@@ -71,11 +75,10 @@ def test_parse_bundle_multiple_authorities():
     assert len(x509_bundle.x509_authorities()) == 2
 
     expected_subjects = ['CN=PEMUTILTEST1', 'CN=PEMUTILTEST2']
-    authority1 = x509_bundle.x509_authorities().pop()
+    authority1, authority2 = x509_bundle.x509_authorities()
     assert isinstance(authority1, Certificate)
     assert authority1.subject.rfc4514_string() in expected_subjects
 
-    authority2 = x509_bundle.x509_authorities().pop()
     assert isinstance(authority2, Certificate)
     assert authority2.subject.rfc4514_string() in expected_subjects
 
@@ -131,15 +134,101 @@ def test_load_bundle():
     assert len(x509_bundle.x509_authorities()) == 2
 
     expected_subjects = ['CN=PEMUTILTEST1', 'CN=PEMUTILTEST2']
-    authority1 = x509_bundle.x509_authorities().pop()
+    authority1, authority2 = x509_bundle.x509_authorities()
     assert isinstance(authority1, Certificate)
     assert authority1.subject.rfc4514_string() in expected_subjects
 
-    authority2 = x509_bundle.x509_authorities().pop()
     assert isinstance(authority2, Certificate)
     assert authority2.subject.rfc4514_string() in expected_subjects
 
 
+def test_load_bundle_cached_until_file_changes(tmpdir, mocker):
+    bundle_path = tmpdir.join('bundle.pem')
+    bundle_path.write_binary(read_bytes('cert.pem'))
+    # the file was just written, consider it old enough to be cached
+    mocker.patch.object(x509_bundle_module, '_is_racy', return_value=False)
+    load_spy = mocker.spy(x509_bundle_module, 'load_certificates_bytes_from_file')
+
+    x509_bundle_1 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+    x509_bundle_2 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+
+    assert load_spy.call_count == 1
+    assert x509_bundle_1 == x509_bundle_2
+    assert x509_bundle_1 is not x509_bundle_2
+    assert len(x509_bundle_2.x509_authorities()) == 1
+
+    bundle_path.write_binary(read_bytes('certs.pem'))
+    x509_bundle_3 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+
+    assert load_spy.call_count == 2
+    assert len(x509_bundle_3.x509_authorities()) == 2
+
+
+def test_load_bundle_reloads_same_size_file_with_restored_mtime(tmpdir):
+    pem_certs = pem.parse_file(_TEST_CERTS_PATH.format('certs.pem'))
+    cert_1_bytes = pem_certs[0].as_bytes()
+    cert_2_bytes = pem_certs[1].as_bytes()
+    assert len(cert_1_bytes) == len(cert_2_bytes)
+
+    bundle_path = tmpdir.join('bundle.pem')
+    bundle_path.write_binary(cert_1_bytes)
+    file_stat = os.stat(bundle_path)
+    x509_bundle_1 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+
+    bundle_path.write_binary(cert_2_bytes)
+    os.utime(bundle_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    x509_bundle_2 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+
+    (authority_1,) = x509_bundle_1.x509_authorities()
+    (authority_2,) = x509_bundle_2.x509_authorities()
+    assert authority_1 == x509.load_pem_x509_certificate(cert_1_bytes)
+    assert authority_2 == x509.load_pem_x509_certificate(cert_2_bytes)
+
+
+def test_load_bundle_recently_modified_file_is_not_cached(tmpdir, mocker):
+    pem_certs = pem.parse_file(_TEST_CERTS_PATH.format('certs.pem'))
+    cert_1_bytes = pem_certs[0].as_bytes()
+    cert_2_bytes = pem_certs[1].as_bytes()
+
+    bundle_path = tmpdir.join('bundle.pem')
+    bundle_path.write_binary(cert_1_bytes)
+    # simulate a coarse filesystem clock: both writes fall in the same tick, so the
+    # timestamps, size and inode of the file are the same after the rewrite
+    real_stat = os.stat(bundle_path)
+    tick_ns = time.time_ns()
+    same_tick_stat = SimpleNamespace(
+        st_dev=real_stat.st_dev,
+        st_ino=real_stat.st_ino,
+        st_mtime_ns=tick_ns,
+        st_ctime_ns=tick_ns,
+        st_size=real_stat.st_size,
+    )
+    mocker.patch.object(x509_bundle_module.os, 'stat', return_value=same_tick_stat)
+
+    x509_bundle_1 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+    bundle_path.write_binary(cert_2_bytes)
+    x509_bundle_2 = X509Bundle.load(
+        trust_domain, bundle_path, serialization.Encoding.PEM
+    )
+
+    (authority_1,) = x509_bundle_1.x509_authorities()
+    (authority_2,) = x509_bundle_2.x509_authorities()
+    assert authority_1 == x509.load_pem_x509_certificate(cert_1_bytes)
+    assert authority_2 == x509.load_pem_x509_certificate(cert_2_bytes)
+
+
 def test_load_bundle_non_existent_file():
     with pytest.raises(LoadX509BundleError) as exception:
         X509Bundle.load(trust_domain, 'no-exists', serialization.Encoding.PEM)
@@ -186,11 +275,10 @@ def test_save_bundle_pem_encoded(tmpdir):
     assert len(saved_bundle.x509_authorities()) == 2
 
     expected_subjects = ['CN=PEMUTILTEST1', 'CN=PEMUTILTEST2']
-    authority1 = saved_bundle.x509_authorities().pop()
+    authority1, authority2 = saved_bundle.x509_authorities()
     assert isinstance(authority1, Certificate)
     assert authority1.subject.rfc4514_string() in expected_subjects
 
-    authority2 = saved_bundle.x509_authorities().pop()
     assert isinstance(authority2, Certificate)
     assert authority2.subject.rfc4514_string() in expected_subjects
 
@@ -211,11 +299,10 @@ def test_save_bundle_der_encoded(tmpdir):
     assert len(saved_bundle.x509_authorities()) == 2
 
     expected_subjects = ['CN=PEMUTILTEST1', 'CN=PEMUTILTEST2']
-    authority1 = saved_bundle.x509_authorities().pop()
+    authority1, authority2 = saved_bundle.x509_authorities()
     assert isinstance(authority1, Certificate)
     assert authority1.subject.rfc4514_string() in expected_subjects
 
-    authority2 = saved_bundle.x509_authorities().pop()
     assert isinstance(authority2, Certificate)
     assert authority2.subject.rfc4514_string() in expected_subjects
 
@@ -266,8 +353,9 @@ def test_add_and_remove_authority():
         pem_certs[1].as_bytes(), default_backend()
     )
 
-    # adding an object to the returned set, as it is a copy, it doesn't change the bundle
-    bundle.x509_authorities().add(x509_cert_1)
+    # the returned set is immutable, it cannot be used to change the bundle
+    with pytest.raises(AttributeError):
+        bundle.x509_authorities().add(x509_cert_1)
     assert len(bundle.x509_authorities()) == 0
 
     bundle.add_authority(x509_cert_1)
@@ -299,6 +387,23 @@ def test_not_equal_when_different_objects():
     assert x509_bundle_1 != trust_domain
 
 
+def test_equal_bundles_have_same_hash():
+    bundle_bytes = read_bytes('certs.pem')
+    x509_bundle_1 = X509Bundle.parse(trust_domain, bundle_bytes)
+    x509_bundle_2 = X509Bundle.parse(trust_domain, bundle_bytes)
+
+    assert x509_bundle_1 == x509_bundle_2
+    assert hash(x509_bundle_1) == hash(x509_bundle_2)
+
+    authority = next(iter(x509_bundle_1.x509_authorities()))
+    x509_bundle_1.remove_authority(authority)
+    assert x509_bundle_1 != x509_bundle_2
+
+    x509_bundle_1.add_authority(authority)
+    assert x509_bundle_1 == x509_bundle_2
+    assert hash(x509_bundle_1) == hash(x509_bundle_2)
+
+
 def read_bytes(filename):
     path = _TEST_CERTS_PATH.format(filename)
     with open(path, 'rb') as file:
@@ -128,6 +128,45 @@ def test_invalid_input_validate_claims(test_input_claim, test_input_audience, ex
             {'else', 'matters'},
             str(InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)),
         ),
+        (
+            {
+                'exp': timegm(
+                    (
+                        datetime.datetime.utcnow() + datetime.timedelta(hours=24)
+                    ).utctimetuple()
+                ),
+                'aud': 'something',
+                'sub': 'spiffeid://somewhere.over.the',
+            },
+            {'some'},
+            str(InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)),
+        ),
+        (
+            {
+                'exp': timegm(
+                    (
+                        datetime.datetime.utcnow() + datetime.timedelta(hours=24)
+                    ).utctimetuple()
+                ),
+                'aud': [['a']],
+                'sub': 'spiffeid://somewhere.over.the',
+            },
+            {'something'},
+            str(InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)),
+        ),
+        (
+            {
+                'exp': timegm(
+                    (
+                        datetime.datetime.utcnow() + datetime.timedelta(hours=24)
+                    ).utctimetuple()
+                ),
+                'aud': [{}],
+                'sub': 'spiffeid://somewhere.over.the',
+            },
+            {'something'},
+            str(InvalidClaimError(AUDIENCE_NOT_MATCH_ERROR)),
+        ),
     ],
 )
 def test_validate_claims_invalid_aud(test_input_claim, test_input_audience, expected):
@@ -260,6 +299,30 @@ def test_validate_claims_missing_required_claim(
             },
             {'something', 'more things'},
         ),
+        (
+            {
+                'exp': timegm(
+                    (
+                        datetime.datetime.utcnow() + datetime.timedelta(minutes=15)
+                    ).utctimetuple()
+                ),
+                'aud': 'something',
+                'sub': 'spiffeid://somewhere.over.the',
+            },
+            {'something'},
+        ),
+        (
+            {
+                'exp': timegm(
+                    (
+                        datetime.datetime.utcnow() + datetime.timedelta(minutes=15)
+                    ).utctimetuple()
+                ),
+                'aud': {'something', 'more things'},
+                'sub': 'spiffeid://somewhere.over.the',
+            },
+            {'more things'},
+        ),
     ],
 )
 def test_validate_claims_valid_input(test_input_claim, test_input_audience):
@@ -5,9 +5,12 @@ from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.x509 import Certificate
 
 from pyspiffe.spiffe_id.spiffe_id import SpiffeId
+from pyspiffe.utils import certificate_utils
 from pyspiffe.utils.certificate_utils import (
     parse_pem_certificates,
+    parse_pem_certificates_iter,
     parse_der_certificates,
+    parse_der_certificates_iter,
     load_certificates_bytes_from_file,
     write_certificates_to_file,
     serialize_certificate,
@@ -28,6 +31,10 @@ from pyspiffe.utils.exceptions import (
 
 _EXPECTED_SPIFFE_ID = SpiffeId.parse('spiffe://example.org/service')
 _TEST_CERTS_PATH = 'test/svid/x509svid/certs/{}'
+_EC_PARAMETERS_PEM = (
+    b'-----BEGIN EC PARAMETERS-----\nBggqhkjOPQMBBw==\n-----END EC PARAMETERS-----\n'
+)
+_UNKNOWN_LABEL_PEM = b'-----BEGIN FOO-----\nAAAA\n-----END FOO-----\n'
 
 
 def test_parse_der_certificates():
@@ -41,6 +48,19 @@ def test_parse_der_certificates():
     assert _extract_spiffe_id(certs[0]) == _EXPECTED_SPIFFE_ID
 
 
+def test_parse_der_certificates_iter():
+    certs_bytes = _read_bytes('1-chain.der')
+
+    certs = parse_der_certificates_iter(certs_bytes)
+
+    cert = next(certs)
+    assert isinstance(cert, Certificate)
+    assert _extract_spiffe_id(cert) == _EXPECTED_SPIFFE_ID
+    assert isinstance(next(certs), Certificate)
+    with pytest.raises(StopIteration):
+        next(certs)
+
+
 def test_parse_pem_certificates():
     certs_bytes = _read_bytes('2-chain.pem')
 
@@ -52,6 +72,84 @@ def test_parse_pem_certificates():
     assert _extract_spiffe_id(certs[0]) == _EXPECTED_SPIFFE_ID
 
 
+def test_parse_pem_certificates_with_non_certificate_block():
+    certs_bytes = _read_bytes('2-chain.pem') + _read_bytes('2-key.pem')
+
+    with pytest.raises(ParseCertificateError) as exception:
+        parse_pem_certificates(certs_bytes)
+
+    assert str(exception.value) == 'Unable to parse PEM X.509 certificate.'
+
+
+@pytest.mark.parametrize(
+    'extra_block',
+    [
+        _EC_PARAMETERS_PEM,
+        _UNKNOWN_LABEL_PEM,
+    ],
+)
+def test_parse_pem_certificates_ignores_unknown_block_types(extra_block):
+    certs_bytes = _read_bytes('2-chain.pem') + extra_block
+
+    certs = parse_pem_certificates(certs_bytes)
+
+    assert len(certs) == 2
+    assert _extract_spiffe_id(certs[0]) == _EXPECTED_SPIFFE_ID
+
+
+def test_parse_pem_certificates_ignores_x509_certificate_label():
+    # a valid certificate under a label that is not parsed, cryptography's batch loader would accept it
+    x509_certificate_block = (
+        _read_bytes('2-chain.pem')
+        .replace(b'BEGIN CERTIFICATE', b'BEGIN X509 CERTIFICATE', 1)
+        .replace(b'END CERTIFICATE', b'END X509 CERTIFICATE', 1)
+    )
+
+    certs = parse_pem_certificates(x509_certificate_block)
+
+    assert len(certs) == 1
+
+
+def test_parse_pem_certificates_decodes_certificate_blocks_in_one_call(mocker):
+    batch_spy = mocker.spy(certificate_utils, '_load_pem_x509_certificates')
+
+    certs = parse_pem_certificates(_read_bytes('2-chain.pem'))
+
+    assert len(certs) == 2
+    assert batch_spy.call_count == 1
+
+
+def test_parse_pem_certificates_iter():
+    certs_bytes = _read_bytes('2-chain.pem')
+
+    certs = parse_pem_certificates_iter(certs_bytes)
+
+    cert = next(certs)
+    assert isinstance(cert, Certificate)
+    assert _extract_spiffe_id(cert) == _EXPECTED_SPIFFE_ID
+    assert isinstance(next(certs), Certificate)
+    with pytest.raises(StopIteration):
+        next(certs)
+
+
+def test_parse_pem_certificates_iter_ignores_unknown_block_types():
+    certs_bytes = _EC_PARAMETERS_PEM + _read_bytes('2-chain.pem') + _UNKNOWN_LABEL_PEM
+
+    certs = list(parse_pem_certificates_iter(certs_bytes))
+
+    assert len(certs) == 2
+    assert _extract_spiffe_id(certs[0]) == _EXPECTED_SPIFFE_ID
+
+
+def test_parse_pem_certificates_iter_corrupted_certificate():
+    certs_bytes = _read_bytes('corrupted')
+
+    with pytest.raises(ParseCertificateError) as exception:
+        list(parse_pem_certificates_iter(certs_bytes))
+
+    assert str(exception.value) == 'Unable to parse PEM X.509 certificate.'
+
+
 def test_parse_der_corrupted_certificate():
     certs_bytes = _read_bytes('corrupted')
 